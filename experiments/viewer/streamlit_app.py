@@ -1,11 +1,20 @@
+import heapq
+import html
+import os
 import streamlit as st # type: ignore
 import boto3 # type: ignore
+from botocore.config import Config # type: ignore
 import pandas as pd # type: ignore
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-import plotly.express as px # type: ignore
+from decimal import Decimal
+from operator import itemgetter
+from pathlib import Path
 import plotly.graph_objects as go # type: ignore
 
+CSS_PATH = Path(__file__).parent / "static" / "app.css"
+
 # Page configuration
 st.set_page_config(
     page_title="VC Startup Sourcer Dashboard",
@@ -14,182 +23,188 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+@st.cache_resource
+def load_css() -> str:
+    """Read the dashboard stylesheet once per process."""
+    return CSS_PATH.read_text()
+
 # Custom CSS for attractive styling
-st.markdown("""
-<style>
-    /* Main stats cards */
-    .metric-card {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        padding: 1.5rem;
-        border-radius: 20px;
-        text-align: center;
-        box-shadow: 0 8px 32px rgba(102, 126, 234, 0.3);
-        border: 1px solid rgba(255, 255, 255, 0.2);
-        backdrop-filter: blur(10px);
-        margin: 0.5rem;
-        transition: transform 0.3s ease;
-    }
-    
-    .metric-card:hover {
-        transform: translateY(-5px);
-        box-shadow: 0 12px 40px rgba(102, 126, 234, 0.4);
-    }
-    
-    .metric-card h3 {
-        color: white;
-        margin: 0;
-        font-size: 0.9rem;
-        font-weight: 600;
-        opacity: 0.9;
-    }
-    
-    .metric-card h1 {
-        color: white;
-        margin: 0.5rem 0 0 0;
-        font-size: 2.5rem;
-        font-weight: 700;
-    }
-    
-    /* Repository cards */
-    .repo-container {
-        background: linear-gradient(135deg, rgba(102, 126, 234, 0.1) 0%, rgba(118, 75, 162, 0.1) 100%);
-        border: 2px solid #667eea;
-        border-radius: 20px;
-        padding: 2rem;
-        margin: 1.5rem 0;
-        box-shadow: 0 8px 32px rgba(102, 126, 234, 0.15);
-        backdrop-filter: blur(5px);
-        position: relative;
-        overflow: hidden;
-    }
-    
-    .repo-container::before {
-        content: '';
-        position: absolute;
-        top: 0;
-        left: 0;
-        right: 0;
-        height: 4px;
-        background: linear-gradient(90deg, #667eea, #764ba2, #667eea);
-        animation: shimmer 3s infinite;
-    }
-    
-    @keyframes shimmer {
-        0% { transform: translateX(-100%); }
-        100% { transform: translateX(100%); }
-    }
-    
-    /* Score badge */
-    .score-badge {
-        background: linear-gradient(45deg, #ff6b6b, #ffa726);
-        color: white;
-        padding: 0.8rem 1.5rem;
-        border-radius: 30px;
-        font-weight: bold;
-        font-size: 1.3rem;
-        display: inline-block;
-        box-shadow: 0 4px 15px rgba(255, 107, 107, 0.4);
-        border: 2px solid rgba(255, 255, 255, 0.3);
-    }
-    
-    /* Rank badges */
-    .rank-badge {
-        width: 60px;
-        height: 60px;
-        border-radius: 50%;
-        display: flex;
-        align-items: center;
-        justify-content: center;
-        font-weight: bold;
-        font-size: 1.8rem;
-        margin: 0 auto 1rem auto;
-        box-shadow: 0 6px 20px rgba(0,0,0,0.3);
-        border: 3px solid rgba(255,255,255,0.3);
-    }
+st.markdown(f"<style>{load_css()}</style>", unsafe_allow_html=True)
+
+DYNAMODB_TABLE_NAME = "vc-sourcing-analysis"
+
+# Flattened DynamoDB attribute -> dashboard column
+REPO_COLUMNS = {
+    'repo_name': 'repo_name',
+    'final_score': 'final_score',
+    'analysis_date': 'analysis_date',
+    'oss_insight_data.stars': 'stars',
+    'oss_insight_data.total_score': 'total_score',
+    'oss_insight_data.description': 'description',
+    'repo_analysis.problem_clarity_score': 'problem_clarity_score',
+    'repo_analysis.adoption_ease_score': 'adoption_ease_score',
+    'repo_analysis.maturity_health_score': 'maturity_health_score',
+    'repo_analysis.problem_solved': 'problem_solved',
+    'community_analysis.excitement_score': 'excitement_score',
+    'community_analysis.problem_solution_fit_score': 'problem_solution_fit_score',
+    'community_analysis.credibility_adoption_score': 'credibility_adoption_score',
+    'community_analysis.key_praise_quote': 'key_praise_quote',
+    'community_analysis.main_criticism': 'main_criticism',
+}
+
+def build_projection(attribute_paths: List[str]) -> Tuple[str, Dict[str, str]]:
+    """Build a ProjectionExpression with every path segment aliased so reserved words are safe."""
+    aliases: Dict[str, str] = {}
+    for path in attribute_paths:
+        for segment in path.split('.'):
+            aliases.setdefault(segment, f"#a{len(aliases)}")
     
-    /* Chart container */
-    .chart-container {
-        background: rgba(255, 255, 255, 0.05);
-        border-radius: 15px;
-        padding: 1rem;
-        margin: 1rem 0;
-        border: 1px solid rgba(102, 126, 234, 0.2);
+    expression = ", ".join(".".join(aliases[segment] for segment in path.split('.')) for path in attribute_paths)
+    return expression, {alias: segment for segment, alias in aliases.items()}
+
+# Only the (nested) attributes the dashboard renders; everything else stays server-side
+DASHBOARD_PROJECTION, DASHBOARD_PROJECTION_NAMES = build_projection(list(REPO_COLUMNS))
+
+# Number of parallel scan segments (DynamoDB TotalSegments), one worker thread each
+SCAN_SEGMENTS = 8
+
+# Keep enough pooled connections warm for every scan thread
+DYNAMODB_CONFIG = Config(max_pool_connections=16, retries={'max_attempts': 3})
+
+def get_dynamodb_resource(session: boto3.Session) -> Any:
+    """Return a DAX-backed DynamoDB resource when AMAZONDAX_ENDPOINT is set, else plain boto3."""
+    dax_endpoint = os.environ.get('AMAZONDAX_ENDPOINT')
+    if dax_endpoint:
+        try:
+            import amazondax # type: ignore
+            return amazondax.AmazonDaxClient.resource(endpoint_url=dax_endpoint, session=session)
+        except Exception as e:
+            st.warning(f"DAX unavailable, falling back to DynamoDB: {e}")
+    return session.resource('dynamodb', config=DYNAMODB_CONFIG)
+
+def convert_from_dynamodb_format(obj: Any) -> Any:
+    """Convert DynamoDB Decimals in an item to plain int/float values."""
+    if isinstance(obj, dict):
+        return {k: convert_from_dynamodb_format(v) for k, v in obj.items()}
+    elif isinstance(obj, list):
+        return [convert_from_dynamodb_format(item) for item in obj]
+    elif isinstance(obj, Decimal):
+        return int(obj) if obj == obj.to_integral_value() else float(obj)
+    else:
+        return obj
+
+def _scan_segment(table: Any, segment: int, total_segments: int) -> List[Dict[str, Any]]:
+    """Read every page of one parallel-scan segment."""
+    scan_kwargs: Dict[str, Any] = {
+        'ProjectionExpression': DASHBOARD_PROJECTION,
+        'ExpressionAttributeNames': DASHBOARD_PROJECTION_NAMES,
+        'Segment': segment,
+        'TotalSegments': total_segments,
     }
-</style>
-""", unsafe_allow_html=True)
+    items: List[Dict[str, Any]] = []
+    while True:
+        response = table.scan(**scan_kwargs)
+        items.extend(response['Items'])
+        if 'LastEvaluatedKey' not in response:
+            return items
+        scan_kwargs['ExclusiveStartKey'] = response['LastEvaluatedKey']
+
+def _scan_all_segments(table: Any, total_segments: int) -> List[Dict[str, Any]]:
+    """Scan all segments on a thread pool and merge the results."""
+    # boto3 releases the GIL while waiting on the network, so the segments overlap
+    with ThreadPoolExecutor(max_workers=total_segments) as executor:
+        segment_results = executor.map(
+            lambda segment: _scan_segment(table, segment, total_segments),
+            range(total_segments)
+        )
+        return [item for segment_items in segment_results for item in segment_items]
+
+@st.cache_resource
+def get_dynamodb_table() -> Any:
+    """Create the boto3 session and analysis Table once per process and reuse it across reruns."""
+    session = boto3.Session(profile_name='root')
+    # st.cache_data is the per-process L1 cache, DAX (if configured) the shared L2
+    dynamodb = get_dynamodb_resource(session)
+    return dynamodb.Table(DYNAMODB_TABLE_NAME)
 
 @st.cache_data(ttl=300)  # Cache for 5 minutes
 def load_dynamodb_data(limit: int = 50) -> List[Dict[str, Any]]:
-    """Load data from DynamoDB with caching."""
+    """Load the top `limit` repositories by final score from DynamoDB with caching."""
     try:
-        session = boto3.Session(profile_name='root')
-        dynamodb = session.resource('dynamodb')
-        table = dynamodb.Table("vc-sourcing-analysis")
+        table = get_dynamodb_table()
         
-        response = table.scan()
-        items = response['Items']
+        # Scan order is not score order, so every page has to be read before the
+        # top entries are known; segments are scanned in parallel to cut wall-clock time
+        items = _scan_all_segments(table, SCAN_SEGMENTS)
         
-        # Sort by final_score in descending order
-        sorted_items = sorted(items, key=lambda x: float(x.get('final_score', 0)), reverse=True)
+        # Keep only the top `limit` by final_score; the score is converted once per
+        # item up front rather than on every heap comparison
+        scored_items = [(float(item.get('final_score', 0)), item) for item in items]
+        top_items = heapq.nlargest(limit, scored_items, key=lambda scored: scored[0])
         
-        return sorted_items[:limit]
+        # Convert Decimals once per kept item so formatting works on plain numbers
+        return [convert_from_dynamodb_format(item) for _, item in top_items]
         
     except Exception as e:
         st.error(f"Error loading data from DynamoDB: {e}")
         return []
 
-def format_repo_data(items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-    """Format DynamoDB items for display."""
-    formatted_repos = []
+# 0-5 rubric scores; missing when the repo or community analysis was not run
+SCORE_COLUMNS = [
+    'problem_clarity_score',
+    'adoption_ease_score',
+    'maturity_health_score',
+    'excitement_score',
+    'problem_solution_fit_score',
+    'credibility_adoption_score',
+]
+
+TEXT_DEFAULTS = {
+    'repo_name': 'Unknown',
+    'analysis_date': 'Unknown',
+    'description': 'No description available',
+    'problem_solved': 'Not analyzed',
+    'key_praise_quote': '',
+    'main_criticism': '',
+}
+
+def format_repo_data(items: List[Dict[str, Any]]) -> pd.DataFrame:
+    """Format DynamoDB items into a DataFrame for display."""
+    df = pd.json_normalize(items, max_level=1)
+    df = df.reindex(columns=list(REPO_COLUMNS)).rename(columns=REPO_COLUMNS)
     
-    for item in items:
-        oss_data = item.get('oss_insight_data', {})
-        repo_analysis = item.get('repo_analysis', {})
-        community_analysis = item.get('community_analysis', {})
-        
-        repo_data = {
-            'repo_name': item.get('repo_name', 'Unknown'),
-            'final_score': float(item.get('final_score', 0)),
-            'analysis_date': item.get('analysis_date', 'Unknown'),
-            'stars': int(oss_data.get('stars', 0)),
-            'total_score': float(oss_data.get('total_score', 0)),
-            'description': oss_data.get('description', 'No description available'),
-            'problem_clarity_score': int(repo_analysis.get('problem_clarity_score', 0)) if repo_analysis.get('problem_clarity_score') else None,
-            'adoption_ease_score': int(repo_analysis.get('adoption_ease_score', 0)) if repo_analysis.get('adoption_ease_score') else None,
-            'maturity_health_score': int(repo_analysis.get('maturity_health_score', 0)) if repo_analysis.get('maturity_health_score') else None,
-            'problem_solved': repo_analysis.get('problem_solved', 'Not analyzed'),
-            'excitement_score': int(community_analysis.get('excitement_score', 0)) if community_analysis.get('excitement_score') else None,
-            'problem_solution_fit_score': int(community_analysis.get('problem_solution_fit_score', 0)) if community_analysis.get('problem_solution_fit_score') else None,
-            'credibility_adoption_score': int(community_analysis.get('credibility_adoption_score', 0)) if community_analysis.get('credibility_adoption_score') else None,
-            'key_praise_quote': community_analysis.get('key_praise_quote', ''),
-            'main_criticism': community_analysis.get('main_criticism', '')
-        }
-        
-        formatted_repos.append(repo_data)
+    # Compact dtypes keep the cached frame small as the number of repos grows
+    df = df.fillna(TEXT_DEFAULTS)
+    df[['final_score', 'total_score']] = df[['final_score', 'total_score']].apply(pd.to_numeric, errors='coerce').fillna(0).astype('float32')
+    df['stars'] = pd.to_numeric(df['stars'], errors='coerce').fillna(0).astype('int32')
+    df[SCORE_COLUMNS] = df[SCORE_COLUMNS].apply(pd.to_numeric, errors='coerce').astype('Int8')
+    df['analysis_date'] = df['analysis_date'].astype('category')
     
-    return formatted_repos
+    return df
 
-def create_score_visualization(repos: List[Dict[str, Any]]):
-    """Create a score distribution chart."""
-    df = pd.DataFrame(repos)
-    
+# Separators shown as spaces in chart labels
+_DISPLAY_NAME_TRANSLATION = str.maketrans('_-', '  ')
+
+@st.cache_data(ttl=300)
+def create_score_visualization(top_scores: pd.DataFrame) -> go.Figure:
+    """Create a score distribution chart from a repo_name/final_score frame."""
     # Clean up repository names for display
-    df['display_name'] = df['repo_name'].str.replace('_', ' ').str.replace('-', ' ').str.title()
+    df = top_scores.assign(display_name=top_scores['repo_name'].str.translate(_DISPLAY_NAME_TRANSLATION).str.title())
     
-    fig = px.bar(
-        df.head(10), 
-        x='display_name', 
-        y='final_score',
-        title="Top 10 Repositories by VC Score",
-        color='final_score',
-        color_continuous_scale='viridis',
-        labels={
-            'display_name': 'Repository Name',
-            'final_score': 'VC Score'
-        }
-    )
+    fig = go.Figure(go.Bar(
+        x=df['display_name'],
+        y=df['final_score'],
+        marker=dict(
+            color=df['final_score'],
+            colorscale='Viridis',
+            showscale=True,
+            colorbar=dict(title='VC Score')
+        ),
+        hovertemplate="Repository Name=%{x}<br>VC Score=%{y}<extra></extra>"
+    ))
     
     fig.update_layout(
+        title="Top 10 Repositories by VC Score",
         xaxis_tickangle=-45,
         height=400,
         showlegend=False,
@@ -201,6 +216,168 @@ def create_score_visualization(repos: List[Dict[str, Any]]):
 
 
 
+# Leaderboard card templates, formatted once per repository and sent as a single markdown block
+_REPO_HEADER_TMPL = """
+<div style="display: flex; align-items: center; gap: 1.5rem; margin-bottom: 1.5rem;">
+    <div style="background: {rank_gradient}; color: {rank_text_color}; 
+               width: 60px; height: 60px; flex-shrink: 0; border-radius: 50%; 
+               display: flex; align-items: center; justify-content: center; 
+               font-weight: bold; font-size: 1.8rem;
+               box-shadow: 0 6px 20px rgba({shadow_color}, 0.4), inset 0 2px 4px rgba(255,255,255,0.3);
+               border: 2px solid rgba(255,255,255,0.2);">
+        {rank}
+    </div>
+    <h2 style="flex: 1; margin: 0;">{repo_name}</h2>
+    <div style="background: linear-gradient(45deg, #667eea, #764ba2); 
+               color: white; padding: 0.8rem 1.5rem; border-radius: 25px; 
+               font-weight: bold; font-size: 1.4rem; white-space: nowrap;
+               box-shadow: 0 4px 15px rgba(102, 126, 234, 0.4);">
+        🏆 {final_score:.1f}
+    </div>
+</div>
+<div style="display: flex; margin-bottom: 1.5rem;">
+    <div style="flex: 1; text-align: center; padding: 1.5rem; background: linear-gradient(135deg, #667eea, #764ba2); 
+               border-radius: 15px; margin: 1rem 0.5rem; box-shadow: 0 4px 12px rgba(102, 126, 234, 0.3);">
+        <div style="color: white; font-size: 2.2rem; font-weight: bold;">⭐ {stars:,}</div>
+        <div style="color: rgba(255,255,255,0.8); font-size: 1rem;">Stars</div>
+    </div>
+    <div style="flex: 1; text-align: center; padding: 1.5rem; background: linear-gradient(135deg, #764ba2, #667eea); 
+               border-radius: 15px; margin: 1rem 0.5rem; box-shadow: 0 4px 12px rgba(118, 75, 162, 0.3);">
+        <div style="color: white; font-size: 2.2rem; font-weight: bold;">📈 {total_score:,.0f}</div>
+        <div style="color: rgba(255,255,255,0.8); font-size: 1rem;">Total Score</div>
+    </div>
+</div>
+"""
+
+# Leaderboard cards shown open; the rest are collapsed into expanders
+EXPANDED_CARD_COUNT = 5
+
+# Card fields fetched in one batched lookup per repository
+_REPO_ANALYSIS_SCORES = itemgetter('problem_clarity_score', 'adoption_ease_score', 'maturity_health_score')
+_COMMUNITY_ANALYSIS_SCORES = itemgetter('excitement_score', 'problem_solution_fit_score', 'credibility_adoption_score')
+_QUOTE_FIELDS = itemgetter('key_praise_quote', 'main_criticism')
+
+# Rank badge (gradient, text color, shadow rgb) for gold, silver, bronze, then everyone else
+_RANK_STYLES = (
+    ("linear-gradient(135deg, #FFD700, #FFA500, #FFD700)", "#000", "255, 215, 0"),
+    ("linear-gradient(135deg, #E5E5E5, #C0C0C0, #E5E5E5)", "#000", "192, 192, 192"),
+    ("linear-gradient(135deg, #CD7F32, #A0522D, #CD7F32)", "#FFF", "205, 127, 50"),
+    ("linear-gradient(135deg, #667eea, #764ba2, #667eea)", "#FFF", "102, 126, 234"),
+)
+
+# Both analysis sections share one flex row; each section is a heading over its cards
+_METRIC_ROW_TMPL = """
+<div style="display: flex; flex-wrap: wrap; gap: 1rem; margin-bottom: 1.5rem;">{sections}
+</div>
+"""
+
+_METRIC_SECTION_TMPL = """
+<div style="flex: 1; min-width: 18rem;">
+    <h3>{heading}</h3>
+    <div style="display: flex;">{cards}
+    </div>
+</div>"""
+
+_METRIC_CARD_TMPL = """
+        <div style="flex: 1; text-align: center; padding: 1rem; background: {bg_color}; 
+                   border-radius: 10px; margin: 0.5rem 0.2rem; box-shadow: 0 2px 8px rgba(0,0,0,0.2);">
+            <div style="color: white; font-size: 1.8rem; font-weight: bold;">{value}/5</div>
+            <div style="color: rgba(255,255,255,0.8); font-size: 0.9rem;">{label}</div>
+        </div>"""
+
+def _metric_section_html(heading: str, metrics: List[Tuple[str, Any]], bg_color: str) -> str:
+    """Render a heading and its /5 metric cards as one section of the metric row."""
+    cards = "".join(_METRIC_CARD_TMPL.format(bg_color=bg_color, value=value, label=label) for label, value in metrics)
+    return _METRIC_SECTION_TMPL.format(heading=heading, cards=cards)
+
+def render_repo_table(repos_df: pd.DataFrame) -> None:
+    """Render the leaderboard as a single native dataframe."""
+    table_df = repos_df.drop(columns=['analysis_date'])
+    table_df.insert(0, 'rank', range(1, len(table_df) + 1))
+    
+    st.dataframe(
+        table_df,
+        hide_index=True,
+        use_container_width=True,
+        column_config={
+            'rank': st.column_config.NumberColumn("#", format="%d"),
+            'repo_name': st.column_config.TextColumn("Repository"),
+            'final_score': st.column_config.ProgressColumn("🏆 VC Score", min_value=0, max_value=100, format="%.1f"),
+            'stars': st.column_config.NumberColumn("Stars", format="%d ⭐"),
+            'total_score': st.column_config.NumberColumn("📈 Total Score", format="%.0f"),
+            'description': st.column_config.TextColumn("📋 Description"),
+            'problem_solved': st.column_config.TextColumn("🎯 Problem Solved"),
+            'problem_clarity_score': st.column_config.NumberColumn("🎯 Problem Clarity", format="%d/5"),
+            'adoption_ease_score': st.column_config.NumberColumn("⚡ Ease of Adoption", format="%d/5"),
+            'maturity_health_score': st.column_config.NumberColumn("💊 Project Maturity", format="%d/5"),
+            'excitement_score': st.column_config.NumberColumn("😊 Community Excitement", format="%d/5"),
+            'problem_solution_fit_score': st.column_config.NumberColumn("📈 Solution Fit", format="%d/5"),
+            'credibility_adoption_score': st.column_config.NumberColumn("🏅 Credibility", format="%d/5"),
+            'key_praise_quote': st.column_config.TextColumn("💬 Key Praise"),
+            'main_criticism': st.column_config.TextColumn("⚠️ Main Criticism"),
+        }
+    )
+
+def render_repo_cards(repos: List[Dict[str, Any]], show_detailed_metrics: bool) -> None:
+    """Render the leaderboard as one styled card per repository."""
+    for idx, repo in enumerate(repos, 1):
+        
+        # Create a boxed container using native Streamlit; cards past the top few start collapsed
+        if idx <= EXPANDED_CARD_COUNT:
+            card = st.container(border=True)
+        else:
+            card = st.expander(f"#{idx} {repo['repo_name']}", expanded=False)
+        
+        with card:
+            # Custom rank badge with gradients
+            rank_gradient, rank_text_color, shadow_color = _RANK_STYLES[min(idx - 1, len(_RANK_STYLES) - 1)]
+            
+            # Header (rank, name, score) and repository metrics in one block
+            st.markdown(_REPO_HEADER_TMPL.format(
+                rank_gradient=rank_gradient,
+                rank_text_color=rank_text_color,
+                shadow_color=shadow_color,
+                rank=idx,
+                repo_name=html.escape(repo['repo_name']),
+                final_score=repo['final_score'],
+                stars=repo['stars'],
+                total_score=repo['total_score'],
+            ), unsafe_allow_html=True)
+            
+            # Description in a styled box with spacing
+            st.info(f"**📋 Description:** {repo['description']}")
+            
+            # Problem solved in a styled box with spacing
+            problem_solved = repo['problem_solved']
+            if problem_solved and problem_solved != 'Not analyzed':
+                st.info(f"**🎯 Problem Solved:** {problem_solved}")
+            
+            # Add detailed metrics with custom styling and emojis
+            metric_sections = []
+            if show_detailed_metrics:
+                repo_scores = _REPO_ANALYSIS_SCORES(repo)
+                if repo_scores[0] is not None:
+                    metric_sections.append(_metric_section_html("📊 Repository Analysis", list(zip(
+                        ("🎯 Problem Clarity", "⚡ Ease of Adoption", "💊 Project Maturity"), repo_scores
+                    )), "#667eea"))
+                
+                community_scores = _COMMUNITY_ANALYSIS_SCORES(repo)
+                if community_scores[0] is not None:
+                    metric_sections.append(_metric_section_html("👥 Community Analysis", list(zip(
+                        ("😊 Community Excitement", "📈 Solution Fit", "🏅 Credibility"), community_scores
+                    )), "#27ae60"))
+            
+            if metric_sections:
+                st.markdown(_METRIC_ROW_TMPL.format(sections="".join(metric_sections)), unsafe_allow_html=True)
+            
+            # Add quotes and criticism using native Streamlit components
+            key_praise_quote, main_criticism = _QUOTE_FIELDS(repo)
+            if key_praise_quote:
+                st.success(f"**💬 Key Praise:** \"{key_praise_quote}\"")
+            
+            if main_criticism:
+                st.warning(f"**⚠️ Main Criticism:** {main_criticism}")
+
 def main():
     # Header with custom styling
     st.markdown("""
@@ -218,210 +395,47 @@ def main():
     st.sidebar.markdown("## 📊 Dashboard Controls")
     limit = st.sidebar.slider("Number of repositories to display", 5, 50, 20)
     show_charts = st.sidebar.checkbox("Show visualization charts", True)
-    show_detailed_metrics = st.sidebar.checkbox("Show detailed metrics", True)
+    show_detailed_cards = st.sidebar.toggle("Detailed cards", False)
+    show_detailed_metrics = st.sidebar.checkbox("Show detailed metrics", True, disabled=not show_detailed_cards)
     
     # Load data
     with st.spinner("Loading data from DynamoDB..."):
         raw_data = load_dynamodb_data(limit)
-        repos = format_repo_data(raw_data)
+        repos_df = format_repo_data(raw_data)
     
-    if not repos:
+    if repos_df.empty:
         st.error("No data available. Please check your DynamoDB connection.")
         return
     
-    # Overview stats with gradient styling to match repository metrics
-    col1, col2, col3, col4 = st.columns(4)
-    
-    with col1:
-        st.markdown(f"""
-        <div style="text-align: center; padding: 1.5rem; background: linear-gradient(135deg, #667eea, #764ba2); 
-                   border-radius: 15px; margin: 1rem 0.5rem; box-shadow: 0 4px 12px rgba(102, 126, 234, 0.3);">
-            <div style="color: white; font-size: 2.2rem; font-weight: bold;">📋 {len(repos)}</div>
-            <div style="color: rgba(255,255,255,0.8); font-size: 1rem;">Total Repos</div>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col2:
-        avg_score = sum(r['final_score'] for r in repos) / len(repos)
-        st.markdown(f"""
-        <div style="text-align: center; padding: 1.5rem; background: linear-gradient(135deg, #764ba2, #667eea); 
-                   border-radius: 15px; margin: 1rem 0.5rem; box-shadow: 0 4px 12px rgba(118, 75, 162, 0.3);">
-            <div style="color: white; font-size: 2.2rem; font-weight: bold;">📊 {avg_score:.1f}</div>
-            <div style="color: rgba(255,255,255,0.8); font-size: 1rem;">Average Score</div>
-        </div>
-        """, unsafe_allow_html=True)
+    # Overview stats computed column-wise on the formatted frame
+    total_repos = len(repos_df)
+    avg_score = repos_df['final_score'].mean()
+    total_stars = int(repos_df['stars'].sum())
+    analyzed_repos = int(repos_df['problem_clarity_score'].notna().sum())
     
-    with col3:
-        total_stars = sum(r['stars'] for r in repos)
-        st.markdown(f"""
-        <div style="text-align: center; padding: 1.5rem; background: linear-gradient(135deg, #667eea, #764ba2); 
-                   border-radius: 15px; margin: 1rem 0.5rem; box-shadow: 0 4px 12px rgba(102, 126, 234, 0.3);">
-            <div style="color: white; font-size: 2.2rem; font-weight: bold;">⭐ {total_stars:,}</div>
-            <div style="color: rgba(255,255,255,0.8); font-size: 1rem;">Total Stars</div>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col4:
-        analyzed_repos = len([r for r in repos if r['problem_clarity_score'] is not None])
-        st.markdown(f"""
-        <div style="text-align: center; padding: 1.5rem; background: linear-gradient(135deg, #764ba2, #667eea); 
-                   border-radius: 15px; margin: 1rem 0.5rem; box-shadow: 0 4px 12px rgba(118, 75, 162, 0.3);">
-            <div style="color: white; font-size: 2.2rem; font-weight: bold;">🔍 {analyzed_repos}/{len(repos)}</div>
-            <div style="color: rgba(255,255,255,0.8); font-size: 1rem;">Analyzed</div>
-        </div>
-        """, unsafe_allow_html=True)
+    # Overview stats as native metrics, styled by the stMetric rules in the page CSS
+    col1, col2, col3, col4 = st.columns(4)
+    col1.metric("📋 Total Repos", total_repos)
+    col2.metric("📊 Average Score", f"{avg_score:.1f}")
+    col3.metric("⭐ Total Stars", f"{total_stars:,}")
+    col4.metric("🔍 Analyzed", f"{analyzed_repos}/{total_repos}")
     
     # Visualization
-    if show_charts and repos:
+    if show_charts:
         st.markdown("## 📈 Score Distribution")
-        chart = create_score_visualization(repos)
+        # Only the two chart columns are passed so reruns with the same top 10 hit the cache
+        top_scores = repos_df.nlargest(10, 'final_score')[['repo_name', 'final_score']]
+        chart = create_score_visualization(top_scores)
         st.plotly_chart(chart, use_container_width=True)
     
     # Leaderboard
     st.markdown("## 🏆 Repository Leaderboard")
     
-    for idx, repo in enumerate(repos, 1):
-        
-        # Create a boxed container using native Streamlit
-        with st.container(border=True):
-            # Header section with rank and repository name
-            col_rank, col_title, col_score = st.columns([1, 4, 2])
-            
-            with col_rank:
-                # Custom rank badge with gradients
-                if idx == 1:
-                    rank_gradient = "linear-gradient(135deg, #FFD700, #FFA500, #FFD700)"
-                    rank_text_color = "#000"
-                    shadow_color = "255, 215, 0"
-                elif idx == 2:
-                    rank_gradient = "linear-gradient(135deg, #E5E5E5, #C0C0C0, #E5E5E5)"
-                    rank_text_color = "#000"
-                    shadow_color = "192, 192, 192"
-                elif idx == 3:
-                    rank_gradient = "linear-gradient(135deg, #CD7F32, #A0522D, #CD7F32)"
-                    rank_text_color = "#FFF"
-                    shadow_color = "205, 127, 50"
-                else:
-                    rank_gradient = "linear-gradient(135deg, #667eea, #764ba2, #667eea)"
-                    rank_text_color = "#FFF"
-                    shadow_color = "102, 126, 234"
-                
-                st.markdown(f"""
-                <div style="background: {rank_gradient}; color: {rank_text_color}; 
-                           width: 60px; height: 60px; border-radius: 50%; 
-                           display: flex; align-items: center; justify-content: center; 
-                           font-weight: bold; font-size: 1.8rem; margin: 0 auto;
-                           box-shadow: 0 6px 20px rgba({shadow_color}, 0.4), inset 0 2px 4px rgba(255,255,255,0.3);
-                           border: 2px solid rgba(255,255,255,0.2);">
-                    {idx}
-                </div>
-                """, unsafe_allow_html=True)
-            
-            with col_title:
-                st.markdown(f"## {repo['repo_name']}")
-            
-            with col_score:
-                # Custom score badge on the right
-                st.markdown(f"""
-                <div style="background: linear-gradient(45deg, #667eea, #764ba2); 
-                           color: white; padding: 0.8rem 1.5rem; border-radius: 25px; 
-                           font-weight: bold; font-size: 1.4rem; display: inline-block;
-                           box-shadow: 0 4px 15px rgba(102, 126, 234, 0.4); margin-top: 0.5rem;">
-                    🏆 {repo['final_score']:.1f}
-                </div>
-                """, unsafe_allow_html=True)
-            
-            # Add spacing
-            st.markdown("<br>", unsafe_allow_html=True)
-            
-            # Repository metrics with custom styling and spacing
-            col_stars, col_total = st.columns(2)
-            with col_stars:
-                st.markdown(f"""
-                <div style="text-align: center; padding: 1.5rem; background: linear-gradient(135deg, #667eea, #764ba2); 
-                           border-radius: 15px; margin: 1rem 0.5rem; box-shadow: 0 4px 12px rgba(102, 126, 234, 0.3);">
-                    <div style="color: white; font-size: 2.2rem; font-weight: bold;">⭐ {repo['stars']:,}</div>
-                    <div style="color: rgba(255,255,255,0.8); font-size: 1rem;">Stars</div>
-                </div>
-                """, unsafe_allow_html=True)
-            with col_total:
-                st.markdown(f"""
-                <div style="text-align: center; padding: 1.5rem; background: linear-gradient(135deg, #764ba2, #667eea); 
-                           border-radius: 15px; margin: 1rem 0.5rem; box-shadow: 0 4px 12px rgba(118, 75, 162, 0.3);">
-                    <div style="color: white; font-size: 2.2rem; font-weight: bold;">📈 {repo['total_score']:,.0f}</div>
-                    <div style="color: rgba(255,255,255,0.8); font-size: 1rem;">Total Score</div>
-                </div>
-                """, unsafe_allow_html=True)
-            
-            # Add more spacing
-            st.markdown("<br>", unsafe_allow_html=True)
-            
-            # Description in a styled box with spacing
-            st.info(f"**📋 Description:** {repo['description']}")
-            
-            # Problem solved in a styled box with spacing
-            if repo['problem_solved'] and repo['problem_solved'] != 'Not analyzed':
-                st.info(f"**🎯 Problem Solved:** {repo['problem_solved']}")
-            
-            # Add spacing before metrics
-            st.markdown("<br>", unsafe_allow_html=True)
-                
-            # Add detailed metrics with custom styling and emojis
-            if show_detailed_metrics and repo['problem_clarity_score'] is not None:
-                st.markdown("### 📊 Repository Analysis")
-                col_a, col_b, col_c = st.columns(3)
-                
-                metrics_data = [
-                    ("🎯 Problem Clarity", repo['problem_clarity_score']),
-                    ("⚡ Ease of Adoption", repo['adoption_ease_score']), 
-                    ("💊 Project Maturity", repo['maturity_health_score'])
-                ]
-                
-                for col, (label, value) in zip([col_a, col_b, col_c], metrics_data):
-                    with col:
-                        col.markdown(f"""
-                        <div style="text-align: center; padding: 1rem; background: #667eea; 
-                                   border-radius: 10px; margin: 0.5rem 0.2rem; box-shadow: 0 2px 8px rgba(0,0,0,0.2);">
-                            <div style="color: white; font-size: 1.8rem; font-weight: bold;">{value}/5</div>
-                            <div style="color: rgba(255,255,255,0.8); font-size: 0.9rem;">{label}</div>
-                        </div>
-                        """, unsafe_allow_html=True)
-                
-                # Add spacing
-                st.markdown("<br>", unsafe_allow_html=True)
-            
-            if show_detailed_metrics and repo['excitement_score'] is not None:
-                st.markdown("### 👥 Community Analysis")
-                col_a, col_b, col_c = st.columns(3)
-                
-                community_data = [
-                    ("😊 Community Excitement", repo['excitement_score']),
-                    ("📈 Solution Fit", repo['problem_solution_fit_score']),
-                    ("🏅 Credibility", repo['credibility_adoption_score'])
-                ]
-                
-                for col, (label, value) in zip([col_a, col_b, col_c], community_data):
-                    with col:
-                        col.markdown(f"""
-                        <div style="text-align: center; padding: 1rem; background: #27ae60; 
-                                   border-radius: 10px; margin: 0.5rem 0.2rem; box-shadow: 0 2px 8px rgba(0,0,0,0.2);">
-                            <div style="color: white; font-size: 1.8rem; font-weight: bold;">{value}/5</div>
-                            <div style="color: rgba(255,255,255,0.8); font-size: 0.9rem;">{label}</div>
-                        </div>
-                        """, unsafe_allow_html=True)
-                
-                # Add spacing
-                st.markdown("<br>", unsafe_allow_html=True)
-            
-            # Add quotes and criticism using native Streamlit components
-            if repo['key_praise_quote']:
-                st.success(f"**💬 Key Praise:** \"{repo['key_praise_quote']}\"")
-            
-            if repo['main_criticism']:
-                st.warning(f"**⚠️ Main Criticism:** {repo['main_criticism']}")
-            
-            # Add spacing between repositories (no horizontal lines needed)
-            st.markdown("<br><br>", unsafe_allow_html=True)
+    if show_detailed_cards:
+        # Plain records for the per-repo cards (missing scores become None)
+        render_repo_cards(repos_df.to_dict('records'), show_detailed_metrics)
+    else:
+        render_repo_table(repos_df)
     
     # Footer
     st.markdown("""